@@ -1,18 +1,173 @@
 import sys
 import os
+import time
+import shutil
+import threading
+import queue
+import hashlib
+import socket
 from typing import Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
-import yt_dlp
+import urllib.request
+from urllib.parse import unquote, urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLineEdit, QTextEdit, QProgressBar, QLabel,
     QFileDialog, QStatusBar, QMenuBar, QMenu, QMessageBox,
     QFrame, QScrollArea, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, QThreadPool, QRunnable, QObject, pyqtSignal, QSize
 from PyQt6.QtGui import QAction, QIcon, QFont, QPalette, QColor
 
+# Minimum time between progress updates sent to the GUI (seconds)
+PROGRESS_INTERVAL = 0.1
+# Read size for streamed HTTP downloads (bytes)
+CHUNK_SIZE = 1 << 20
+# Largest blocking read when the stream has no read1(), so progress,
+# pause and cancel stay responsive on slow links (bytes)
+MAX_BLOCKING_READ = 256 << 10
+# Chunks allowed to wait for the disk writer before the network read blocks
+WRITE_QUEUE_DEPTH = 4
+# Number of downloads allowed to run at the same time. Downloads run on a
+# thread pool rather than an asyncio loop because yt-dlp is blocking.
+MAX_CONCURRENT_DOWNLOADS = min(8, (os.cpu_count() or 1) * 2)
+# How long closing the window waits for running downloads to stop (ms)
+SHUTDOWN_TIMEOUT_MS = 5000
+# File extensions treated as direct video links
+_DIRECT_EXTS = ('.mp4', '.webm', '.mkv', '.avi', '.mov', '.flv')
+
+# Shared HTTP session so downloads from the same host reuse connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# Serialises resumed workers taking back a pool slot
+_RESERVE_LOCK = threading.Lock()
+
+# yt_dlp is slow to import, so it is loaded on first use
+_YTDLP = None
+
+def _ytdlp():
+    global _YTDLP
+    if _YTDLP is None:
+        import yt_dlp
+        _YTDLP = yt_dlp
+    return _YTDLP
+
+def _abort_response(response):
+    """Shut down the socket under an HTTP response so a read blocked on it returns at once.
+
+    Takes an http.client response (urllib) or a urllib3 response (requests' response.raw).
+    """
+    # urllib3 wraps the http.client response in _fp
+    fp = getattr(response, '_fp', response)
+    if fp is None or fp.fp is None:
+        # Already finished or closed, nothing can be blocked on it
+        return
+    try:
+        sock = fp.fp.raw._sock
+    except AttributeError as e:
+        print(f"Unable to abort download connection: {str(e)}")
+        return
+    try:
+        # Closing the response doesn't wake a blocked recv(); shutting the socket down does
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        # Socket already closed
+        pass
+
+class _CancellableReader:
+    """File-like wrapper that honours pause/cancel and reports progress on each read."""
+    
+    def __init__(self, worker: 'DownloadWorker', raw, total_size: int, offset: int = 0):
+        self.worker = worker
+        self.raw = raw
+        self.total_size = total_size
+        self.downloaded = offset
+
+    def read(self, size: int = -1) -> bytes:
+        # Handle pause
+        self.worker.wait_if_paused()
+        
+        if self.worker.is_cancelled:
+            raise Exception("Download cancelled")
+        
+        if size <= 0:
+            size = CHUNK_SIZE
+        
+        read1 = getattr(self.raw, 'read1', None)
+        if read1 is None:
+            data = self.raw.read(min(size, MAX_BLOCKING_READ))
+        else:
+            # read1 returns whatever has arrived (one TLS record over HTTPS), so gather
+            # pieces into one block until it is full or a progress update is due
+            parts = []
+            received = 0
+            deadline = time.monotonic() + PROGRESS_INTERVAL
+            while received < size:
+                part = read1(size - received)
+                if not part:
+                    break
+                parts.append(part)
+                received += len(part)
+                if self.worker.is_cancelled or time.monotonic() >= deadline:
+                    break
+            data = b''.join(parts)
+        
+        # An aborted socket reads as EOF; don't let that pass for a finished download
+        if self.worker.is_cancelled:
+            raise Exception("Download cancelled")
+        if data and self.total_size > 0:
+            self.downloaded += len(data)
+            self.worker.report_transfer(self.downloaded, self.total_size, len(data))
+        return data
+
+class _BackgroundWriter:
+    """File-like sink that writes on a separate thread so disk stalls don't hold up the socket."""
+    
+    def __init__(self, f):
+        self.f = f
+        self.queue = queue.Queue(maxsize=WRITE_QUEUE_DEPTH)
+        self.error: Optional[Exception] = None
+        self.thread = threading.Thread(target=self._drain, daemon=True)
+        self.thread.start()
+
+    def _drain(self):
+        while True:
+            data = self.queue.get()
+            if data is None:
+                return
+            # Keep consuming after a failure so the producer never blocks on a full queue
+            if self.error is None:
+                try:
+                    self.f.write(data)
+                except Exception as e:
+                    self.error = e
+
+    def write(self, data: bytes):
+        if self.error is not None:
+            raise self.error
+        self.queue.put(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Flush everything queued so far before the file is closed
+        self.queue.put(None)
+        self.thread.join()
+        if self.error is not None and exc_type is None:
+            raise self.error
+
 class DownloadStatus(Enum):
     QUEUED = "Queued"
     DOWNLOADING = "Downloading"
@@ -27,26 +182,108 @@ class DownloadInfo:
     status: DownloadStatus
     progress: float
     filename: str
-    thread: Optional['DownloadThread'] = None
+    worker: Optional['DownloadWorker'] = None
     size: str = "Unknown"
     speed: str = "0 MB/s"
     eta: str = "Unknown"
 
-class DownloadThread(QThread):
+class DownloadSignals(QObject):
+    started_signal = pyqtSignal(str)
     progress_signal = pyqtSignal(str, float, str, str, str)
     finished_signal = pyqtSignal(str, bool)
-    
-    def __init__(self, url: str, output_path: str):
+
+class DownloadWorker(QRunnable):
+    def __init__(self, url: str, output_path: str, pool: QThreadPool):
         super().__init__()
+        # Signals live on a QObject created in the GUI thread, so emits are queued to it
+        self.signals = DownloadSignals()
+        # Kept alive by DownloadInfo; lets a queued worker be withdrawn from the pool
+        self.setAutoDelete(False)
+        self.pool = pool
         self.url = url
         self.output_path = output_path
-        self.is_paused = False
+        # Set while running; cleared to park the worker until resumed
+        self._resume = threading.Event()
+        self._resume.set()
         self.is_cancelled = False
+        # HTTP response currently being read, aborted on cancel
+        self._response = None
+        self._last_emit = 0.0
+        self._acc_bytes = 0
+        self._size_str = "Unknown"
+
+    def pause(self):
+        self._resume.clear()
+
+    def resume(self):
+        self._resume.set()
+
+    def cancel(self):
+        self.is_cancelled = True
+        # Wake the worker if it is parked in wait_if_paused
+        self._resume.set()
+        # Unblock a read waiting on the network
+        response = self._response
+        if response is not None:
+            _abort_response(response)
+
+    def wait_if_paused(self):
+        """Block without polling while the download is paused."""
+        if self._resume.is_set():
+            return
+        # Hand the pool slot to a queued download while parked
+        self.pool.releaseThread()
+        try:
+            self._resume.wait()
+        finally:
+            # reserveThread() ignores maxThreadCount, so wait until a slot is free again
+            # (queued downloads may have taken it) to keep the concurrency bound
+            with _RESERVE_LOCK:
+                while (not self.is_cancelled
+                       and self.pool.activeThreadCount() >= self.pool.maxThreadCount()):
+                    time.sleep(PROGRESS_INTERVAL)
+                self.pool.reserveThread()
+
+    def should_emit_progress(self) -> bool:
+        """Throttle progress signals to at most one per PROGRESS_INTERVAL."""
+        now = time.monotonic()
+        if now - self._last_emit >= PROGRESS_INTERVAL:
+            self._last_emit = now
+            return True
+        return False
+
+    def start_transfer(self, total_size: int):
+        """Reset throughput tracking and format the size once for the whole transfer."""
+        self._last_emit = time.monotonic()
+        self._acc_bytes = 0
+        self._size_str = f"{total_size / 1024 / 1024:.1f} MB" if total_size > 0 else "Unknown"
+
+    def report_transfer(self, downloaded: int, total_size: int, received: int):
+        """Track received bytes and emit throttled progress with throughput and ETA."""
+        self._acc_bytes += received
+        now = time.monotonic()
+        elapsed = now - self._last_emit
+        if elapsed < PROGRESS_INTERVAL:
+            return
+        
+        progress = (downloaded / total_size) * 100
+        speed = self._acc_bytes / elapsed  # bytes/s
+        eta_str = f"{int((total_size - downloaded) / speed)}s" if speed else "Unknown"
+        
+        self.signals.progress_signal.emit(
+            self.url,
+            progress,
+            self._size_str,
+            f"{speed / 1024 / 1024:.1f} MB/s",
+            eta_str
+        )
+        self._last_emit = now
+        self._acc_bytes = 0
 
     def is_direct_link(self) -> bool:
         """Check if the URL is a direct video link."""
-        video_extensions = ['.mp4', '.webm', '.mkv', '.avi', '.mov', '.flv']
-        return any(self.url.lower().endswith(ext) for ext in video_extensions)
+        # Check the path only, so query strings don't hide the extension
+        return urlparse(self.url).path.lower().endswith(_DIRECT_EXTS)
 
     def get_headers(self) -> dict:
         """Get appropriate headers for the request."""
@@ -57,151 +294,212 @@ class DownloadThread(QThread):
             'Referer': self.url,
         }
 
+    def get_output_file(self) -> str:
+        """Get the output path for a download named after the URL."""
+        file_name = unquote(os.path.basename(urlparse(self.url).path))
+        if not file_name:
+            file_name = f'video_{int(time.time())}.mp4'
+        return os.path.join(self.output_path, file_name)
+
+    def get_part_file(self, output_path: str) -> str:
+        """Get the partial file path, keyed on the URL so same-named files from other hosts never mix."""
+        url_hash = hashlib.sha1(self.url.encode()).hexdigest()[:12]
+        return f'{output_path}.{url_hash}.part'
+
+    @staticmethod
+    def get_validator(response) -> Optional[str]:
+        """Get a validator usable in If-Range to check a resumed file hasn't changed."""
+        etag = response.headers.get('etag')
+        # Weak ETags are not allowed in If-Range
+        if etag and not etag.startswith('W/'):
+            return etag
+        return response.headers.get('last-modified')
+
     def download_with_requests(self) -> bool:
         """Download video using requests library for direct links."""
+        response = None
         try:
-            import requests
-            from urllib.parse import unquote, urlparse
-            
-            # Get file name from URL
-            file_name = unquote(os.path.basename(urlparse(self.url).path))
-            if not file_name:
-                file_name = f'video_{int(time.time())}.mp4'
+            output_path = self.get_output_file()
+            part_path = self.get_part_file(output_path)
+            # Validator of the response the partial file came from
+            meta_path = part_path + '.meta'
             
-            output_path = os.path.join(self.output_path, file_name)
+            # Resume a previously interrupted download if a verifiable partial file exists
+            offset = 0
+            headers = self.get_headers()
+            # Range offsets count raw bytes, so the body must not be content-encoded
+            headers['Accept-Encoding'] = 'identity'
+            if os.path.exists(part_path) and os.path.exists(meta_path):
+                with open(meta_path, encoding='utf-8') as meta:
+                    validator = meta.read().strip()
+                offset = os.path.getsize(part_path)
+                if offset and validator:
+                    headers['Range'] = f'bytes={offset}-'
+                    # Server sends the whole file instead if it changed since
+                    headers['If-Range'] = validator
+                else:
+                    offset = 0
             
             # Stream the download
-            response = requests.get(self.url, stream=True, headers=self.get_headers())
-            total_size = int(response.headers.get('content-length', 0))
+            response = _SESSION.get(self.url, stream=True, headers=headers, timeout=(5, 30))
+            self._response = response.raw
+            if self.is_cancelled:
+                raise Exception("Download cancelled")
+            
+            if offset and response.status_code == 416:
+                # Nothing left past the offset: a previous run stopped after its last read
+                total = response.headers.get('content-range', '').rpartition('/')[2]
+                if total.isdigit() and int(total) == offset:
+                    os.replace(part_path, output_path)
+                    os.remove(meta_path)
+                    return True
+                # Partial file doesn't match the remote file, drop it and fetch from the start
+                os.remove(part_path)
+                os.remove(meta_path)
+                offset = 0
+                del headers['Range'], headers['If-Range']
+                response.close()
+                response = _SESSION.get(self.url, stream=True, headers=headers, timeout=(5, 30))
+                self._response = response.raw
+                if self.is_cancelled:
+                    raise Exception("Download cancelled")
+            response.raise_for_status()
             
-            with open(output_path, 'wb') as f:
+            if response.status_code == 206:
+                # Content-Range: bytes <start>-<end>/<total>
+                total = response.headers.get('content-range', '').rpartition('/')[2]
+                total_size = int(total) if total.isdigit() else 0
+            else:
+                # Server ignored the range request or the file changed, start from scratch
+                offset = 0
+                total_size = int(response.headers.get('content-length', 0))
+                validator = self.get_validator(response)
+                if validator:
+                    with open(meta_path, 'w', encoding='utf-8') as meta:
+                        meta.write(validator)
+                elif os.path.exists(meta_path):
+                    # Without a validator this download can't be resumed safely
+                    os.remove(meta_path)
+            
+            with open(part_path, 'ab' if offset else 'wb') as f:
                 if total_size == 0:
                     f.write(response.content)
                 else:
-                    downloaded = 0
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if self.is_cancelled:
-                            return False
-                        
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            # Calculate progress
-                            progress = (downloaded / total_size) * 100
-                            speed = len(chunk) / 1024  # KB/s
-                            
-                            self.progress_signal.emit(
-                                self.url,
-                                progress,
-                                f"{total_size / 1024 / 1024:.1f} MB",
-                                f"{speed / 1024:.1f} MB/s",
-                                "Calculating..."
-                            )
-                            
-                            # Handle pause
-                            while self.is_paused and not self.is_cancelled:
-                                self.msleep(100)
+                    self.start_transfer(total_size)
+                    
+                    # No os.sendfile/splice fast path: the kernel can't send from a socket
+                    # to a file, HTTPS bodies must be decrypted in user space, and
+                    # http.client has already buffered part of the body.
+                    response.raw.decode_content = True
+                    reader = _CancellableReader(self, response.raw, total_size, offset)
+                    with _BackgroundWriter(f) as writer:
+                        shutil.copyfileobj(reader, writer, CHUNK_SIZE)
             
+            os.replace(part_path, output_path)
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
             return True
                 
         except Exception as e:
             print(f"Error with requests download: {str(e)}")
             return False
+        finally:
+            self._response = None
+            # Return the connection to the shared pool on every exit path
+            if response is not None:
+                response.close()
 
     def download_with_urllib(self) -> bool:
         """Download video using urllib as last resort."""
         try:
-            import urllib.request
-            from urllib.parse import unquote, urlparse
-            
-            file_name = unquote(os.path.basename(urlparse(self.url).path))
-            if not file_name:
-                file_name = f'video_{int(time.time())}.mp4'
-            
-            output_path = os.path.join(self.output_path, file_name)
-
-            # Create a custom opener with headers
-            opener = urllib.request.build_opener()
-            opener.addheaders = [(k, v) for k, v in self.get_headers().items()]
-            urllib.request.install_opener(opener)
+            output_path = self.get_output_file()
+            # Write to the partial file and only move it into place once complete.
+            # This copy starts from scratch, so drop the requests path's resume data.
+            part_path = self.get_part_file(output_path)
+            meta_path = part_path + '.meta'
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+
+            # Send headers per request rather than installing a process-wide opener
+            req = urllib.request.Request(self.url, headers=self.get_headers())
             
             # Download with progress tracking
-            def report_progress(count, block_size, total_size):
-                if self.is_cancelled:
-                    raise Exception("Download cancelled")
-                
-                if total_size > 0:
-                    progress = (count * block_size / total_size) * 100
-                    speed = block_size / 1024  # KB/s
-                    
-                    self.progress_signal.emit(
-                        self.url,
-                        progress,
-                        f"{total_size / 1024 / 1024:.1f} MB",
-                        f"{speed / 1024:.1f} MB/s",
-                        "Calculating..."
-                    )
-                
-                # Handle pause
-                while self.is_paused and not self.is_cancelled:
-                    self.msleep(100)
+            with urllib.request.urlopen(req, timeout=30) as resp, open(part_path, 'wb') as f:
+                self._response = resp
+                total_size = int(resp.headers.get('content-length', 0))
+                self.start_transfer(total_size)
+                reader = _CancellableReader(self, resp, total_size)
+                with _BackgroundWriter(f) as writer:
+                    shutil.copyfileobj(reader, writer, CHUNK_SIZE)
             
-            urllib.request.urlretrieve(self.url, output_path, report_progress)
+            # http.client reads an early close as EOF rather than raising
+            if total_size > 0 and reader.downloaded != total_size:
+                raise Exception(f"Connection closed after {reader.downloaded} of {total_size} bytes")
+            
+            os.replace(part_path, output_path)
             return True
                 
         except Exception as e:
             print(f"Error with urllib download: {str(e)}")
             return False
+        finally:
+            self._response = None
 
     def run(self):
         """Main method to handle video download with multiple methods."""
+        if self.is_cancelled:
+            return
+        
+        self.signals.started_signal.emit(self.url)
+        
         try:
-            # First try yt-dlp for all URLs
-            try:
-                ydl_opts = {
-                    'format': 'best',
-                    'outtmpl': os.path.join(self.output_path, '%(title)s.%(ext)s'),
-                    'progress_hooks': [self.progress_hook],
-                    'quiet': True,
-                    'no_warnings': True,
-                    'http_headers': self.get_headers()
-                }
-                
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([self.url])
-                    
-                if not self.is_cancelled:
-                    self.finished_signal.emit(self.url, True)
-                    return
-            except Exception as e:
-                print(f"yt-dlp download failed: {str(e)}")
-                if self.is_cancelled:
-                    return
-            
-            # If it's a direct link, try requests
             if self.is_direct_link():
+                # Plain file URL: fetch it directly and skip yt-dlp's extractor probing
                 if self.download_with_requests():
                     if not self.is_cancelled:
-                        self.finished_signal.emit(self.url, True)
+                        self.signals.finished_signal.emit(self.url, True)
                     return
+                if self.is_cancelled:
+                    return
+            else:
+                # Try yt-dlp for everything else
+                try:
+                    ydl_opts = {
+                        'format': 'best',
+                        'outtmpl': os.path.join(self.output_path, '%(title)s.%(ext)s'),
+                        'progress_hooks': [self.progress_hook],
+                        'quiet': True,
+                        'no_warnings': True,
+                        'http_headers': self.get_headers()
+                    }
+                    
+                    with _ytdlp().YoutubeDL(ydl_opts) as ydl:
+                        ydl.download([self.url])
+                        
+                    if not self.is_cancelled:
+                        self.signals.finished_signal.emit(self.url, True)
+                        return
+                except Exception as e:
+                    print(f"yt-dlp download failed: {str(e)}")
+                    if self.is_cancelled:
+                        return
             
             # Last resort: try urllib
             if self.download_with_urllib():
                 if not self.is_cancelled:
-                    self.finished_signal.emit(self.url, True)
+                    self.signals.finished_signal.emit(self.url, True)
                 return
             
             # If all methods failed
             if not self.is_cancelled:
-                self.finished_signal.emit(self.url, False)
+                self.signals.finished_signal.emit(self.url, False)
                 
         except Exception as e:
             if not self.is_cancelled:
-                self.finished_signal.emit(self.url, False)
+                self.signals.finished_signal.emit(self.url, False)
 
     def progress_hook(self, d):
-        if d['status'] == 'downloading':
+        if d['status'] == 'downloading' and self.should_emit_progress():
             # Calculate progress
             total = d.get('total_bytes', 0)
             downloaded = d.get('downloaded_bytes', 0)
@@ -226,7 +524,7 @@ class DownloadThread(QThread):
             eta_str = f"{eta}s" if eta else "Unknown"
 
             # Emit progress signal
-            self.progress_signal.emit(
+            self.signals.progress_signal.emit(
                 self.url,
                 progress,
                 size,
@@ -234,13 +532,12 @@ class DownloadThread(QThread):
                 eta_str
             )
 
-            # Handle pause
-            while self.is_paused and not self.is_cancelled:
-                self.msleep(100)
+        # Handle pause
+        self.wait_if_paused()
 
-            # Handle cancel
-            if self.is_cancelled:
-                raise Exception("Download cancelled")
+        # Handle cancel
+        if self.is_cancelled:
+            raise Exception("Download cancelled")
 
 class DownloadWidget(QFrame):
     def __init__(self, url: str, parent=None):
@@ -295,10 +592,120 @@ class DownloadWidget(QFrame):
         # Set minimum height for the widget
         self.setMinimumHeight(150)
 
+# Application style, built once at import time
+_STYLESHEET = """
+    QWidget {
+        background-color: #1e1e1e;
+        color: #ffffff;
+    }
+    QMainWindow {
+        background-color: #1e1e1e;
+        color: #ffffff;
+    }
+    QFrame {
+        background-color: #2d2d2d;
+        border-radius: 5px;
+        color: #ffffff;
+    }
+    QPushButton {
+        background-color: #ff6b00;
+        color: white;
+        border: none;
+        padding: 5px 15px;
+        border-radius: 3px;
+        min-width: 80px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #ff8533;
+    }
+    QPushButton:pressed {
+        background-color: #cc5500;
+    }
+    QLineEdit {
+        padding: 5px;
+        border: 1px solid #3d3d3d;
+        border-radius: 3px;
+        background-color: #2d2d2d;
+        color: white;
+    }
+    QProgressBar {
+        border: 1px solid #3d3d3d;
+        border-radius: 3px;
+        text-align: center;
+        background-color: #2d2d2d;
+        color: white;
+    }
+    QProgressBar::chunk {
+        background-color: #ff6b00;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QStatusBar {
+        background-color: #1e1e1e;
+        color: #ffffff;
+    }
+    QMenuBar {
+        background-color: #1e1e1e;
+        color: #ffffff;
+    }
+    QMenuBar::item {
+        background-color: #1e1e1e;
+        color: #ffffff;
+    }
+    QMenuBar::item:selected {
+        background-color: #2d2d2d;
+    }
+    QMenu {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        border: 1px solid #3d3d3d;
+    }
+    QMenu::item:selected {
+        background-color: #3d3d3d;
+    }
+    QScrollArea {
+        background-color: #1e1e1e;
+        border: none;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: #2d2d2d;
+        width: 10px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #3d3d3d;
+        min-height: 20px;
+        border-radius: 5px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar:horizontal {
+        border: none;
+        background: #2d2d2d;
+        height: 10px;
+        margin: 0px;
+    }
+    QScrollBar::handle:horizontal {
+        background: #3d3d3d;
+        min-width: 20px;
+        border-radius: 5px;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0px;
+    }
+"""
+
 class VideoDownloaderGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.downloads: Dict[str, DownloadInfo] = {}
+        self.widgets: Dict[str, DownloadWidget] = {}
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(MAX_CONCURRENT_DOWNLOADS)
         # Create videos directory in current working directory
         self.output_path = os.path.join(os.getcwd(), "videos")
         if not os.path.exists(self.output_path):
@@ -374,111 +781,7 @@ class VideoDownloaderGUI(QMainWindow):
 
     def apply_styles(self):
         # Set the application style
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QMainWindow {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QFrame {
-                background-color: #2d2d2d;
-                border-radius: 5px;
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #ff6b00;
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 3px;
-                min-width: 80px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #ff8533;
-            }
-            QPushButton:pressed {
-                background-color: #cc5500;
-            }
-            QLineEdit {
-                padding: 5px;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                background-color: #2d2d2d;
-                color: white;
-            }
-            QProgressBar {
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                text-align: center;
-                background-color: #2d2d2d;
-                color: white;
-            }
-            QProgressBar::chunk {
-                background-color: #ff6b00;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QStatusBar {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QMenuBar {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QMenuBar::item {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QMenuBar::item:selected {
-                background-color: #2d2d2d;
-            }
-            QMenu {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 1px solid #3d3d3d;
-            }
-            QMenu::item:selected {
-                background-color: #3d3d3d;
-            }
-            QScrollArea {
-                background-color: #1e1e1e;
-                border: none;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #2d2d2d;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #3d3d3d;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar:horizontal {
-                border: none;
-                background: #2d2d2d;
-                height: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #3d3d3d;
-                min-width: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-        """)
+        self.setStyleSheet(_STYLESHEET)
 
     def add_download(self):
         # Split by newlines first, then by commas
@@ -487,28 +790,35 @@ class VideoDownloaderGUI(QMainWindow):
         for line in raw_input.split('\n'):
             # Split each line by commas and strip whitespace
             urls.extend([url.strip() for url in line.split(',') if url.strip()])
-        for url in urls:
-            url = url.strip()
-            if url and url not in self.downloads:
-                # Create download info
-                download_info = DownloadInfo(
-                    url=url,
-                    status=DownloadStatus.QUEUED,
-                    progress=0,
-                    filename="Pending..."
-                )
-                self.downloads[url] = download_info
-
-                # Create and setup download widget
-                download_widget = DownloadWidget(url)
-                self.downloads_layout.insertWidget(self.downloads_layout.count() - 1, download_widget)
-
-                # Connect button signals
-                download_widget.pause_button.clicked.connect(lambda u=url: self.toggle_pause(u))
-                download_widget.cancel_button.clicked.connect(lambda u=url: self.cancel_download(u))
-
-                # Start download
-                self.start_download(url)
+        # Suspend repaints so a large batch is laid out once instead of per widget
+        scroll_widget = self.downloads_layout.parentWidget()
+        scroll_widget.setUpdatesEnabled(False)
+        try:
+            for url in urls:
+                url = url.strip()
+                if url and url not in self.downloads:
+                    # Create download info
+                    download_info = DownloadInfo(
+                        url=url,
+                        status=DownloadStatus.QUEUED,
+                        progress=0,
+                        filename="Pending..."
+                    )
+                    self.downloads[url] = download_info
+
+                    # Create and setup download widget
+                    download_widget = DownloadWidget(url)
+                    self.downloads_layout.insertWidget(self.downloads_layout.count() - 1, download_widget)
+                    self.widgets[url] = download_widget
+
+                    # Connect button signals
+                    download_widget.pause_button.clicked.connect(lambda u=url: self.toggle_pause(u))
+                    download_widget.cancel_button.clicked.connect(lambda u=url: self.cancel_download(u))
+
+                    # Start download
+                    self.start_download(url)
+        finally:
+            scroll_widget.setUpdatesEnabled(True)
 
         # Clear input
         self.url_input.clear()
@@ -516,22 +826,27 @@ class VideoDownloaderGUI(QMainWindow):
     def start_download(self, url: str):
         download_info = self.downloads[url]
         
-        # Create and setup download thread
-        thread = DownloadThread(url, self.output_path)
-        thread.progress_signal.connect(lambda u, p, s, sp, e: self.update_progress(u, p, s, sp, e))
-        thread.finished_signal.connect(self.download_finished)
-        
-        # Store thread reference
-        download_info.thread = thread
-        download_info.status = DownloadStatus.DOWNLOADING
+        # Create and setup download worker
+        worker = DownloadWorker(url, self.output_path, self.pool)
+        worker.signals.started_signal.connect(self.download_started)
+        worker.signals.progress_signal.connect(lambda u, p, s, sp, e: self.update_progress(u, p, s, sp, e))
+        worker.signals.finished_signal.connect(self.download_finished)
         
-        # Update UI
-        widget = self.findChild(DownloadWidget, url)
-        if widget:
-            widget.status_label.setText(f"Status: {download_info.status.value}")
+        # Store worker reference; it stays Queued until a pool thread picks it up
+        download_info.worker = worker
         
-        # Start download
-        thread.start()
+        # Start download (queued until a pool thread is free)
+        self.pool.start(worker)
+
+    def download_started(self, url: str):
+        download_info = self.downloads.get(url)
+        if download_info and download_info.status == DownloadStatus.QUEUED:
+            download_info.status = DownloadStatus.DOWNLOADING
+            
+            # Update UI
+            widget = self.widgets.get(url)
+            if widget:
+                widget.status_label.setText(f"Status: {download_info.status.value}")
 
     def update_progress(self, url: str, progress: float, size: str, speed: str, eta: str):
         download_info = self.downloads.get(url)
@@ -541,41 +856,40 @@ class VideoDownloaderGUI(QMainWindow):
             download_info.speed = speed
             download_info.eta = eta
 
-            # Find and update the corresponding widget
-            for i in range(self.downloads_layout.count()):
-                widget = self.downloads_layout.itemAt(i).widget()
-                if isinstance(widget, DownloadWidget) and widget.url == url:
-                    widget.progress_bar.setValue(int(progress))
-                    widget.size_label.setText(f"Size: {size}")
-                    widget.speed_label.setText(f"Speed: {speed}")
-                    widget.eta_label.setText(f"ETA: {eta}")
-                    break
+            # Update the corresponding widget
+            widget = self.widgets.get(url)
+            if widget:
+                widget.progress_bar.setValue(int(progress))
+                widget.size_label.setText(f"Size: {size}")
+                widget.speed_label.setText(f"Speed: {speed}")
+                widget.eta_label.setText(f"ETA: {eta}")
 
     def toggle_pause(self, url: str):
         download_info = self.downloads.get(url)
-        if download_info and download_info.thread:
-            widget = self.findChild(DownloadWidget, url)
+        if download_info and download_info.worker:
+            widget = self.widgets.get(url)
             if download_info.status == DownloadStatus.DOWNLOADING:
                 download_info.status = DownloadStatus.PAUSED
-                download_info.thread.is_paused = True
+                download_info.worker.pause()
                 if widget:
                     widget.pause_button.setText("Resume")
                     widget.status_label.setText(f"Status: {download_info.status.value}")
             elif download_info.status == DownloadStatus.PAUSED:
                 download_info.status = DownloadStatus.DOWNLOADING
-                download_info.thread.is_paused = False
+                download_info.worker.resume()
                 if widget:
                     widget.pause_button.setText("Pause")
                     widget.status_label.setText(f"Status: {download_info.status.value}")
 
     def cancel_download(self, url: str):
         download_info = self.downloads.get(url)
-        if download_info and download_info.thread:
-            download_info.thread.is_cancelled = True
+        if download_info and download_info.worker:
+            download_info.worker.cancel()
+            self.pool.tryTake(download_info.worker)
             download_info.status = DownloadStatus.CANCELLED
             
             # Update UI
-            widget = self.findChild(DownloadWidget, url)
+            widget = self.widgets.get(url)
             if widget:
                 widget.status_label.setText(f"Status: {download_info.status.value}")
                 widget.pause_button.setEnabled(False)
@@ -613,6 +927,7 @@ class VideoDownloaderGUI(QMainWindow):
         # Remove from downloads dictionary
         for url in urls_to_remove:
             del self.downloads[url]
+            del self.widgets[url]
         
         # Show status message
         count = len(widgets_to_remove)
@@ -628,8 +943,11 @@ class VideoDownloaderGUI(QMainWindow):
             download_info.status = DownloadStatus.COMPLETED if success else DownloadStatus.ERROR
             
             # Update UI
-            widget = self.findChild(DownloadWidget, url)
+            widget = self.widgets.get(url)
             if widget:
+                if success:
+                    # The last throttled progress update may be short of 100%
+                    widget.progress_bar.setValue(100)
                 widget.status_label.setText(f"Status: {download_info.status.value}")
                 widget.pause_button.setEnabled(False)
                 widget.cancel_button.setEnabled(False)
@@ -641,16 +959,6 @@ class VideoDownloaderGUI(QMainWindow):
                         color: #ffffff;
                     }
                 """)
-        download_info = self.downloads.get(url)
-        if download_info:
-            download_info.status = DownloadStatus.COMPLETED if success else DownloadStatus.ERROR
-            
-            # Update UI
-            widget = self.findChild(DownloadWidget, url)
-            if widget:
-                widget.status_label.setText(f"Status: {download_info.status.value}")
-                widget.pause_button.setEnabled(False)
-                widget.cancel_button.setEnabled(False)
 
     def change_output_directory(self):
         new_dir = QFileDialog.getExistingDirectory(
@@ -680,11 +988,14 @@ class VideoDownloaderGUI(QMainWindow):
 
     def closeEvent(self, event):
         """Handle application closing."""
-        # Cancel all active downloads
-        for url, download_info in self.downloads.items():
-            if download_info.thread and download_info.thread.isRunning():
-                download_info.thread.is_cancelled = True
-                download_info.thread.wait()
+        # Cancel all active downloads first so they wind down in parallel
+        for download_info in self.downloads.values():
+            if download_info.worker:
+                download_info.worker.cancel()
+        self.pool.clear()
+        # HTTP reads are aborted by cancel(), but yt-dlp only stops at its next
+        # progress callback, so don't let it hold the window open
+        self.pool.waitForDone(SHUTDOWN_TIMEOUT_MS)
         event.accept()
 
 def main():
@@ -21,7 +21,7 @@ if not exist venv (
     
     echo Installing required packages...
     call venv\Scripts\activate
-    pip install PyQt6 yt-dlp
+    pip install PyQt6 yt-dlp requests
     if errorlevel 1 (
         echo Failed to install required packages!
         pause